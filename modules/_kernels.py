@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+_kernels.py
+Kernels numéricos usados pelo módulo de eletrólise nos caminhos quentes
+(produção e tensão da célula e simulação de séries temporais)
+
+Com o Numba instalado, os kernels são compilados na importação (assinaturas
+explícitas) e guardados em cache no disco. Sem o Numba, são usadas versões
+equivalentes em Python/NumPy com a mesma interface.
+
+Referências:
+- Eq. 2.8: Sobretensão de ativação (Tafel)
+- Eq. 2.9: Produção de hidrogênio
+- Eq. 2.29: Tensão de operação
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+    NUMBA_DISPONIVEL = True
+except ImportError:  # Numba é opcional: sem ele usam-se as versões em NumPy
+    NUMBA_DISPONIVEL = False
+
+
+def _tafel(j, inv_j0, termo, R_ohm, V_rev):
+    """
+    Tensão da célula para uma densidade de corrente (Eq. 2.29 com Tafel, Eq. 2.8)
+    
+    Args:
+        j: Densidade de corrente (A/m²)
+        inv_j0: Inverso da densidade de corrente de troca (m²/A)
+        termo: Termo de Tafel 2.3RT/αF (V)
+        R_ohm: Resistência ôhmica específica (Ω·m²)
+        V_rev: Tensão reversível (V)
+    
+    Returns:
+        Tensão da célula (V)
+    """
+    razao_corrente = j * inv_j0
+    
+    # Sobretensão nula para j <= j0 (nunca negativa)
+    V_act = termo * math.log10(razao_corrente) if razao_corrente > 1.0 else 0.0
+    
+    return V_rev + V_act + j * R_ohm
+
+
+def _especializar(func):
+    """
+    Compila com o Numba uma função gerada em tempo de execução (se disponível)
+    
+    Usado para funções especializadas cujas constantes ficam capturadas no
+    closure; a compilação é feita na primeira chamada.
+    """
+    return njit(fastmath=True)(func) if NUMBA_DISPONIVEL else func
+
+
+if NUMBA_DISPONIVEL:
+    # O cache do Numba guarda o nome do módulo: importado fora do pacote (ao
+    # executar eletrolise.py como script) não pode reaproveitar o cache de modules._kernels
+    _USAR_CACHE = bool(__package__)
+    
+    # Arrays contíguos ([::1]) para acessos sequenciais no laço compilado
+    _VETOR = types.Array(types.float64, 1, 'C')
+    _VETOR_LEITURA = types.Array(types.float64, 1, 'C', readonly=True)
+    
+    def _assinaturas(n_escalares, n_saidas):
+        """
+        Assinaturas de um kernel (array de entrada, escalares, arrays de saída)
+        
+        Uma para entrada gravável e outra para entrada somente leitura
+        (ex.: arrays com writeable=False); as saídas são sempre graváveis.
+        """
+        resto = (types.float64,) * n_escalares + (_VETOR,) * n_saidas
+        return [types.void(_VETOR, *resto), types.void(_VETOR_LEITURA, *resto)]
+    
+    _tafel = njit('float64(float64, float64, float64, float64, float64)', cache=_USAR_CACHE, fastmath=True)(_tafel)
+    
+    @njit(_assinaturas(4, 1), cache=_USAR_CACHE, fastmath=True, parallel=True)
+    def _tafel_batch(j, inv_j0, termo, R_ohm, V_rev, out):
+        """
+        Aplica _tafel a uma série de densidades de corrente
+        
+        Args:
+            j: Densidades de corrente (A/m²)
+            inv_j0, termo, R_ohm, V_rev: Ver _tafel
+            out: Saída - tensões da célula (V)
+        """
+        for i in prange(j.shape[0]):
+            out[i] = _tafel(j[i], inv_j0, termo, R_ohm, V_rev)
+    
+    # Sem fastmath: NaN (lacuna na série de potência) deve resultar em NaN, como np.clip
+    @njit(_assinaturas(2, 1), cache=_USAR_CACHE, parallel=True)
+    def _producao_batch(P, P_nom, k, out):
+        """
+        Produção de H2 para uma série de potências (Eq. 2.9), limitada a [0, P_nom]
+        
+        Args:
+            P: Potências elétricas de entrada (kW)
+            P_nom: Potência nominal (kW)
+            k: Fator η_el/h_L (kg/kWh)
+            out: Saída - produção de H2 (kg/h)
+        """
+        for i in prange(P.shape[0]):
+            p = P[i]
+            if p < 0.0:
+                p = 0.0
+            elif p > P_nom:
+                p = P_nom
+            out[i] = p * k
+    
+    @njit(_assinaturas(11, 3), cache=_USAR_CACHE, fastmath=True, parallel=True)
+    def _simulate_kernel(P_req, P_nom, eff, V_rev, alpha, R_ohm, j0, area, T_K, F, R, h_L,
+                         out_P, out_V, out_prod):
+        """
+        Kernel compilado da simulação horária (mesmas equações de Eletrolisador.operar)
+        
+        Recebe apenas arrays e escalares (o Numba não enxerga o dataclass de
+        parâmetros) e escreve os resultados nos arrays de saída pré-alocados.
+        
+        Args:
+            P_req: Potências solicitadas (kW)
+            P_nom, eff, V_rev, alpha, R_ohm, j0: Parâmetros do eletrolisador
+            area: Área da célula (m²)
+            T_K: Temperatura de operação (K)
+            F, R, h_L: Constantes físicas
+            out_P: Saída - potência efetiva (kW)
+            out_V: Saída - tensão da célula (V)
+            out_prod: Saída - produção de H2 (kg/h)
+        """
+        # Constantes ao longo da simulação
+        termo = (2.3 * R * T_K) / (alpha * F)  # Eq. 2.8
+        inv_j0 = 1.0 / j0
+        k_corrente = 1000.0 / (V_rev * area * 100.0)  # Densidade de corrente proporcional à potência
+        
+        for i in prange(P_req.shape[0]):
+            P_eff = min(max(P_req[i], 0.0), P_nom)
+            
+            out_P[i] = P_eff
+            out_V[i] = _tafel(P_eff * k_corrente, inv_j0, termo, R_ohm, V_rev)  # Eq. 2.29
+            out_prod[i] = P_eff * eff / h_L  # Eq. 2.9
+else:
+    def _producao_batch(P, P_nom, k, out):
+        """Versão NumPy de _producao_batch, usada quando o Numba não está instalado"""
+        np.clip(P, 0.0, P_nom, out=out)
+        out *= k
+    
+    def _tafel_batch(j, inv_j0, termo, R_ohm, V_rev, out):
+        """
+        Versão NumPy de _tafel_batch, usada quando o Numba não está instalado
+        
+        As etapas são acumuladas no próprio buffer de saída, evitando
+        arrays intermediários para cada termo da Eq. 2.29. O termo ôhmico
+        é calculado antes, pois out pode ser o próprio j (out=j).
+        """
+        V_ohm = j * R_ohm
+        np.multiply(j, inv_j0, out=out)
+        np.maximum(out, 1.0, out=out)  # Sobretensão nula para j <= j0
+        np.log10(out, out=out)
+        out *= termo
+        out += V_rev
+        out += V_ohm
+    
+    def _simulate_kernel(P_req, P_nom, eff, V_rev, alpha, R_ohm, j0, area, T_K, F, R, h_L,
+                         out_P, out_V, out_prod):
+        """
+        Versão NumPy de _simulate_kernel, usada quando o Numba não está instalado
+        
+        Mesma interface e mesmos resultados; cada etapa é uma operação
+        vetorizada sobre a série inteira, sem laço em Python.
+        """
+        termo = (2.3 * R * T_K) / (alpha * F)
+        
+        np.clip(P_req, 0.0, P_nom, out=out_P)
+        _tafel_batch(out_P * (1000.0 / (V_rev * area * 100.0)), 1.0 / j0, termo, R_ohm, V_rev, out_V)
+        np.multiply(out_P, eff / h_L, out=out_prod)
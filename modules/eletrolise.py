@@ -10,23 +10,38 @@ Referências:
 - Eq. 2.9: Produção de hidrogênio
 - Eq. 2.26: Relação com corrente de Faraday
 - Eq. 2.29: Tensão de operação
+
+Exemplo de uso (a partir da raiz do repositório):
+    python -m modules.eletrolise
+    python modules/eletrolise.py
 """
 
+from bisect import bisect_right
+import math
 import numpy as np
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, List
+from enum import IntEnum
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, List, Union
 import logging
 
-# Configurar logging
-logging.basicConfig(level=logging.INFO)
+if __package__:
+    from ._kernels import _especializar, _producao_batch, _simulate_kernel, _tafel, _tafel_batch
+else:
+    # Executado como script (python modules/eletrolise.py): o diretório do
+    # arquivo já está em sys.path, então os kernels são importados diretamente
+    from _kernels import _especializar, _producao_batch, _simulate_kernel, _tafel, _tafel_batch
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParametrosEletrolisador:
     """
     Parâmetros específicos para cada tecnologia de eletrolisador
     Baseado na Tabela 2.1 do artigo
+    
+    Imutável: as constantes derivadas em Eletrolisador são calculadas
+    uma única vez a partir destes valores.
     """
     eficiencia: float          # Eficiência energética (η)
     tensao_reversivel: float   # Tensão reversível (V_rev) em V
@@ -39,6 +54,19 @@ class ParametrosEletrolisador:
     custo_capex_usd_kw: float  # Custo de capital (USD/kW)
 
 
+class TipoEletrolisador(IntEnum):
+    """Tecnologias de eletrolisador suportadas (índice nas tabelas de parâmetros)"""
+    AEL = 0    # Eletrólise Alcalina
+    PEMEL = 1  # Eletrólise com Membrana de Troca de Prótons
+    SOEL = 2   # Eletrólise de Óxido Sólido
+
+
+class ProducaoFaraday(NamedTuple):
+    """Produção de H2 pela Lei de Faraday (Eq. 2.26)"""
+    mol_s: float  # Produção molar (mol/s)
+    kg_h: float   # Produção mássica (kg/h)
+
+
 class Eletrolisador:
     """
     Classe principal para modelagem de eletrolisadores
@@ -51,6 +79,14 @@ class Eletrolisador:
     Implementa todas as equações da Seção 2.1 do artigo
     """
     
+    # Atributos de instância fixos (sem __dict__ por eletrolisador)
+    __slots__ = (
+        'tipo', '_tipo', 'P_nom', 'P_min', 'parametros',
+        '_k_producao', '_k_corrente', '_inv_j0', '_tafel_termo', '_tafel_T_cached',
+        'potencia_atual', '_temperatura_atual', '_T_K', 'horas_operacao',
+        'producao_acumulada_kg', '_cap', '_n', 'historico',
+    )
+    
     # Constantes físicas (SI)
     R = 8.314  # Constante dos gases (J/mol·K)
     F = 96485  # Constante de Faraday (C/mol)
@@ -58,6 +94,19 @@ class Eletrolisador:
     h_HV = 39.39  # Poder calorífico superior do H2 (kWh/kg) - HHV
     massa_molar_h2 = 2.016  # g/mol
     
+    # Fatores constantes pré-calculados (Eq. 2.26)
+    _F_INV = 1.0 / F
+    _MOLAR_TO_KG_H = massa_molar_h2 / 1000 * 3600  # mol/s → kg/h
+    
+    AREA_CELULA = 100  # m² (valor típico)
+    
+    # Curva de eficiência vs carga relativa (interpolação linear entre os pontos)
+    # (tuplas para o caminho escalar, arrays para np.interp)
+    _CARGA_PONTOS = (0.0, 0.3, 0.6, 0.9, 1.0)
+    _FATOR_PONTOS = (0.85, 0.85, 0.92, 0.98, 1.0)
+    _CARGA_XP = np.array(_CARGA_PONTOS)
+    _FATOR_FP = np.array(_FATOR_PONTOS)
+    
     # Parâmetros padrão para cada tecnologia (baseado no artigo)
     PARAMETROS_PADRAO = {
         'AEL': {
@@ -95,24 +144,35 @@ class Eletrolisador:
         }
     }
     
+    # Instâncias prontas (imutáveis) compartilhadas quando não há personalização,
+    # indexadas por TipoEletrolisador (montadas pelo nome, independente da ordem do dict)
+    PARAMETROS_PADRAO_OBJ = tuple(ParametrosEletrolisador(**v)
+                                  for v in map(PARAMETROS_PADRAO.__getitem__, TipoEletrolisador.__members__))
+    
     def __init__(self, 
-                 tipo: str = 'AEL',
+                 tipo: Union[str, TipoEletrolisador] = 'AEL',
                  potencia_nominal: float = 1000,
                  parametros_personalizados: Optional[Dict] = None):
         """
         Inicializa um eletrolisador
         
         Args:
-            tipo: 'AEL', 'PEMEL', ou 'SOEL'
+            tipo: 'AEL', 'PEMEL', 'SOEL' ou um TipoEletrolisador
             potencia_nominal: Potência nominal em kW
             parametros_personalizados: Dicionário com parâmetros customizados
         
         Raises:
             ValueError: Se o tipo for inválido
         """
-        self.tipo = tipo.upper()
-        if self.tipo not in self.PARAMETROS_PADRAO:
-            raise ValueError(f"Tipo inválido: {tipo}. Escolha entre {list(self.PARAMETROS_PADRAO.keys())}")
+        if isinstance(tipo, TipoEletrolisador):
+            self._tipo = tipo
+        else:
+            try:
+                self._tipo = TipoEletrolisador[tipo.upper()]
+            except KeyError:
+                raise ValueError(f"Tipo inválido: {tipo}. "
+                                 f"Escolha entre {list(self.PARAMETROS_PADRAO.keys())}") from None
+        self.tipo = self._tipo.name
         
         self.P_nom = float(potencia_nominal)
         self.P_min = self.P_nom * 0.2  # Carga mínima típica: 20%
@@ -120,21 +180,38 @@ class Eletrolisador:
         # Carregar parâmetros
         self.parametros = self._carregar_parametros(parametros_personalizados)
         
+        # Constantes derivadas dos parâmetros, usadas a cada intervalo de operação
+        p = self.parametros
+        self._k_producao = p.eficiencia / self.h_L  # Eq. 2.9
+        self._k_corrente = 1000 / (p.tensao_reversivel * self.AREA_CELULA * 100)
+        self._inv_j0 = 1.0 / p.densidade_corrente_troca  # Eq. 2.8: j/j0 = j * (1/j0)
+        self._tafel_termo = 0.0
+        self._tafel_T_cached = None
+        
         # Estado operacional
         self.potencia_atual = 0.0
         self.temperatura_atual = self.parametros.temperatura_operacao
         self.horas_operacao = 0
         self.producao_acumulada_kg = 0.0
         
-        # Histórico para debug/análise
-        self.historico = {
-            'potencia': [],
-            'producao': [],
-            'temperatura': [],
-            'tensao': []
-        }
+        # Histórico para debug/análise (buffers contíguos que dobram de tamanho quando cheios)
+        self._cap = 1024
+        self._n = 0
+        self.historico = {k: np.empty(self._cap, dtype=np.float64)
+                          for k in ('potencia', 'producao', 'temperatura', 'tensao')}
         
-        logger.info(f"Eletrolisador {self.tipo} criado: {self.P_nom} kW")
+        logger.info("Eletrolisador %s criado: %s kW", self.tipo, self.P_nom)
+    
+    @property
+    def temperatura_atual(self) -> float:
+        """Temperatura atual de operação (°C)"""
+        return self._temperatura_atual
+    
+    @temperatura_atual.setter
+    def temperatura_atual(self, valor: float):
+        # Mantém a conversão para Kelvin em cache para as equações de tensão
+        self._temperatura_atual = valor
+        self._T_K = valor + 273.15
     
     def _carregar_parametros(self, personalizados: Optional[Dict]) -> ParametrosEletrolisador:
         """
@@ -146,22 +223,11 @@ class Eletrolisador:
         Returns:
             ParametrosEletrolisador configurado
         """
-        base = self.PARAMETROS_PADRAO[self.tipo].copy()
+        if not personalizados:
+            return self.PARAMETROS_PADRAO_OBJ[self._tipo]
         
-        if personalizados:
-            base.update(personalizados)
-        
-        return ParametrosEletrolisador(
-            eficiencia=base['eficiencia'],
-            tensao_reversivel=base['tensao_reversivel'],
-            coeficiente_transferencia=base['coeficiente_transferencia'],
-            densidade_corrente_troca=base['densidade_corrente_troca'],
-            resistencia_ohmica=base['resistencia_ohmica'],
-            temperatura_operacao=base['temperatura_operacao'],
-            pressao_operacao=base['pressao_operacao'],
-            vida_util_anos=base['vida_util_anos'],
-            custo_capex_usd_kw=base['custo_capex_usd_kw']
-        )
+        base = {**self.PARAMETROS_PADRAO[self.tipo], **personalizados}
+        return ParametrosEletrolisador(**base)
     
     # ==================== EQUAÇÕES PRINCIPAIS ====================
     
@@ -173,23 +239,70 @@ class Eletrolisador:
         m_el = (P_in * η_el) / h_L
         
         Args:
-            P_in: Potência elétrica de entrada (kW)
+            P_in: Potência elétrica de entrada (kW) - um np.ndarray usa a versão vetorizada
         
         Returns:
             Produção de H2 (kg/h)
         """
+        if isinstance(P_in, np.ndarray):
+            return self.calcular_producao_array(P_in)
+        
         if P_in <= 0:
             return 0.0
         
-        # Limitar à potência nominal se necessário
-        P_efetiva = min(P_in, self.P_nom)
+        # Limitar à potência nominal e aplicar a Eq. 2.9
+        return min(P_in, self.P_nom) * self._k_producao
+    
+    def calcular_producao_array(self, P_in: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Versão vetorizada da Eq. 2.9 para séries de potência
+        
+        Potências negativas resultam em produção zero e potências acima
+        da nominal são limitadas a P_nom.
+        
+        Args:
+            P_in: Série de potências elétricas de entrada (kW)
+            out: Array de saída (float64 contíguo, mesmo formato de P_in) -
+                opcional, evita alocações em avaliações repetidas
+        
+        Returns:
+            Série de produção de H2 (kg/h)
+        """
+        P_in = np.asarray(P_in, dtype=np.float64)
+        
+        if out is None:
+            out = np.empty(P_in.shape)
+        elif out.shape != P_in.shape or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError("out deve ser um array float64 contíguo com o mesmo formato de P_in")
         
-        # Eq. 2.9
-        producao = (P_efetiva * self.parametros.eficiencia) / self.h_L
+        # Limite [0, P_nom] e Eq. 2.9 em uma única passada, escrita direto em out
+        _producao_batch(np.ascontiguousarray(P_in.ravel()), self.P_nom, self._k_producao, out.reshape(-1))
+        return out
+    
+    def make_producao_fn(self) -> Callable[[float], float]:
+        """
+        Gera uma função escalar de produção (Eq. 2.9) especializada para este eletrolisador
+        
+        P_nom e η_el/h_L ficam fixos no closure, eliminando acessos a
+        atributos e a divisão por h_L a cada chamada. Com o Numba
+        disponível a função é compilada (na primeira chamada) e pode ser
+        usada dentro de outros kernels njit. Útil em varreduras de Monte
+        Carlo com tecnologia fixa.
         
-        return producao
+        Returns:
+            Função P_in (kW) -> produção de H2 (kg/h)
+        """
+        P_nom = self.P_nom
+        k = self._k_producao
+        
+        def producao(P_in):
+            if P_in <= 0.0:
+                return 0.0
+            return (P_in if P_in < P_nom else P_nom) * k
+        
+        return _especializar(producao)
     
-    def calcular_producao_por_corrente(self, I_dc: float, eficiencia_faraday: float = 0.95) -> float:
+    def calcular_producao_por_corrente(self, I_dc: float, eficiencia_faraday: float = 0.95) -> ProducaoFaraday:
         """
         Calcula produção de H2 usando a Lei de Faraday
         
@@ -204,15 +317,28 @@ class Eletrolisador:
             Produção molar (mol/s) e mássica (kg/h)
         """
         # Produção molar (mol/s) - Eq. 2.26
-        producao_molar = (eficiencia_faraday * I_dc) / self.F
+        producao_molar = eficiencia_faraday * I_dc * self._F_INV
         
         # Converter para kg/h
-        producao_kg_h = producao_molar * (self.massa_molar_h2 / 1000) * 3600
+        producao_kg_h = producao_molar * self._MOLAR_TO_KG_H
         
-        return {
-            'mol_s': producao_molar,
-            'kg_h': producao_kg_h
-        }
+        return ProducaoFaraday(producao_molar, producao_kg_h)
+    
+    def calcular_producao_por_corrente_array(self, I_dc: np.ndarray,
+                                             eficiencia_faraday: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versão vetorizada da Eq. 2.26 para varreduras de corrente
+        
+        Args:
+            I_dc: Correntes contínuas (A)
+            eficiencia_faraday: Eficiência de Faraday (η_f)
+        
+        Returns:
+            Arrays de produção molar (mol/s) e mássica (kg/h)
+        """
+        producao_molar = (eficiencia_faraday * self._F_INV) * np.asarray(I_dc, dtype=np.float64)
+        producao_kg_h = producao_molar * self._MOLAR_TO_KG_H
+        return producao_molar, producao_kg_h
     
     def calcular_tensao_operacao(self, j: float, T: Optional[float] = None) -> float:
         """
@@ -222,27 +348,22 @@ class Eletrolisador:
         V = V_rev + V_act + V_ohm
         
         Args:
-            j: Densidade de corrente (A/m²)
+            j: Densidade de corrente (A/m²) - um np.ndarray usa a versão vetorizada
             T: Temperatura (K) - opcional
         
         Returns:
             Tensão da célula (V)
         """
-        if T is None:
-            T = self.temperatura_atual + 273.15  # Converter para Kelvin
-        
-        # Tensão reversível - Eq. 2.29
-        V_rev = self.parametros.tensao_reversivel
+        if isinstance(j, np.ndarray):
+            return self.calcular_tensao_operacao_array(j, T)
         
-        # Sobretensão de ativação - Eq. 2.8
-        V_act = self.calcular_sobretencao_ativacao(j, T)
-        
-        # Sobretensão ôhmica
-        V_ohm = j * self.parametros.resistencia_ohmica
+        if T is None:
+            T = self._T_K  # Temperatura atual em Kelvin
         
-        V_total = V_rev + V_act + V_ohm
+        p = self.parametros
         
-        return V_total
+        # V_rev + sobretensão de ativação (Eq. 2.8) + sobretensão ôhmica
+        return _tafel(j, self._inv_j0, self._termo_tafel(T), p.resistencia_ohmica, p.tensao_reversivel)
     
     def calcular_sobretencao_ativacao(self, j: float, T: Optional[float] = None) -> float:
         """
@@ -254,28 +375,126 @@ class Eletrolisador:
         Para HER (Reação de Evolução de Hidrogênio)
         
         Args:
-            j: Densidade de corrente (A/m²)
+            j: Densidade de corrente (A/m²) - um np.ndarray usa a versão vetorizada
             T: Temperatura (K)
         
         Returns:
             Sobretensão de ativação (V)
         """
+        if isinstance(j, np.ndarray):
+            return self.calcular_sobretencao_ativacao_array(j, T)
+        
         if T is None:
-            T = self.temperatura_atual + 273.15
+            T = self._T_K
         
         # Evitar log de zero ou negativo
         if j <= 0:
             return 0.0
         
         # Garantir que j/j0 > 0
-        razao_corrente = max(j / self.parametros.densidade_corrente_troca, 1e-10)
+        razao_corrente = max(j * self._inv_j0, 1e-10)
         
         # Eq. 2.8 - Tafel equation
-        termo = (2.3 * self.R * T) / (self.parametros.coeficiente_transferencia * self.F)
-        eta = termo * np.log10(razao_corrente)
+        eta = self._termo_tafel(T) * math.log10(razao_corrente)
         
         return max(eta, 0)  # Sobretensão não negativa em operação normal
     
+    def _termo_tafel(self, T: float) -> float:
+        """
+        Retorna o termo 2.3RT/αF da Eq. 2.8, recalculado só quando T muda
+        
+        Args:
+            T: Temperatura (K)
+        """
+        if T != self._tafel_T_cached:
+            self._tafel_termo = (2.3 * self.R * T) / (self.parametros.coeficiente_transferencia * self.F)
+            self._tafel_T_cached = T
+        return self._tafel_termo
+    
+    def calcular_sobretencao_ativacao_array(self, j: np.ndarray, T: Optional[float] = None) -> np.ndarray:
+        """
+        Versão vetorizada da Eq. 2.8 (Tafel) para séries de densidade de corrente
+        
+        Args:
+            j: Densidades de corrente (A/m²)
+            T: Temperatura (K) - escalar ou array compatível com j
+        
+        Returns:
+            Sobretensões de ativação (V)
+        """
+        if T is None:
+            T = self._T_K
+        
+        j = np.asarray(j, dtype=np.float64)
+        
+        p = self.parametros
+        
+        # Eq. 2.8 - Tafel equation (termo calculado uma única vez)
+        if np.ndim(T) == 0:
+            termo = self._termo_tafel(T)
+        else:
+            termo = (2.3 * self.R * np.asarray(T)) / (p.coeficiente_transferencia * self.F)
+        razao_corrente = np.maximum(j * self._inv_j0, 1e-10)
+        eta = termo * np.log10(razao_corrente)
+        
+        # Sobretensão nula para j <= 0 e nunca negativa
+        return np.where(j > 0, np.maximum(eta, 0.0), 0.0)
+    
+    def calcular_tensao_operacao_array(self, j: np.ndarray, T: Optional[float] = None,
+                                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Versão vetorizada da Eq. 2.29 para curvas de polarização
+        
+        Args:
+            j: Densidades de corrente (A/m²)
+            T: Temperatura (K) - opcional; um array é combinado com j por broadcast
+            out: Array de saída (float64, contíguo, formato de j combinado com T) -
+                opcional, permite reaproveitar o buffer em varreduras repetidas
+        
+        Returns:
+            Tensões da célula (V)
+        
+        Raises:
+            ValueError: Se out não for compatível com j e T
+        """
+        if T is None:
+            T = self._T_K
+        
+        p = self.parametros
+        j = np.asarray(j, dtype=np.float64)
+        formato = j.shape if np.ndim(T) == 0 else np.broadcast_shapes(j.shape, np.shape(T))
+        
+        if out is None:
+            out = np.empty(formato)
+        elif out.shape != formato or out.dtype != np.float64 or not out.flags.c_contiguous:
+            raise ValueError("out deve ser um array float64 contíguo com o formato de j combinado com T")
+        
+        if np.ndim(T) == 0:
+            # Tensão calculada em uma única passada, escrita direto em out
+            _tafel_batch(np.ascontiguousarray(j.ravel()), self._inv_j0, self._termo_tafel(T),
+                         p.resistencia_ohmica, p.tensao_reversivel, out.reshape(-1))
+            return out
+        
+        # Temperatura variável ponto a ponto
+        V_act = self.calcular_sobretencao_ativacao_array(j, T)
+        np.add(p.tensao_reversivel + V_act, j * p.resistencia_ohmica, out=out)
+        return out
+    
+    def calcular_densidade_corrente(self, P_in: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Estima a densidade de corrente para uma potência de operação
+        
+        Modelo simplificado usado por operar: densidade de corrente
+        proporcional à potência (sem limitar a potência a [0, P_nom]).
+        
+        Args:
+            P_in: Potência de operação (kW) - escalar ou np.ndarray
+        
+        Returns:
+            Densidade de corrente (A/m²)
+        """
+        return P_in * self._k_corrente
+    
     def calcular_potencia_por_corrente(self, I_dc: float, V_celula: float, n_celulas: int = 100) -> float:
         """
         Calcula potência total a partir da corrente
@@ -297,6 +516,9 @@ class Eletrolisador:
         """
         Opera o eletrolisador por um período de tempo
         
+        Para séries longas (ex.: simulações anuais) use operar_array, que
+        processa a série inteira sem criar um dicionário por intervalo.
+        
         Args:
             potencia_solicitada: Potência solicitada (kW)
             delta_t_horas: Intervalo de tempo (horas)
@@ -304,26 +526,34 @@ class Eletrolisador:
         Returns:
             Dicionário com resultados da operação
         """
-        # Verificar limites operacionais
+        # Verificar limites operacionais (mensagens formatadas só se o aviso for emitido)
+        avisar = logger.isEnabledFor(logging.WARNING)
+        
         if potencia_solicitada < self.P_min and potencia_solicitada > 0:
-            logger.warning(f"Potência {potencia_solicitada:.1f} kW abaixo do mínimo ({self.P_min:.1f} kW)")
+            if avisar:
+                logger.warning("Potência %.1f kW abaixo do mínimo (%.1f kW)", potencia_solicitada, self.P_min)
             # Pode optar por desligar ou operar no mínimo
         
         if potencia_solicitada > self.P_nom:
-            logger.warning(f"Potência {potencia_solicitada:.1f} kW acima do nominal ({self.P_nom:.1f} kW)")
+            if avisar:
+                logger.warning("Potência %.1f kW acima do nominal (%.1f kW)", potencia_solicitada, self.P_nom)
             potencia_efetiva = self.P_nom
         else:
             potencia_efetiva = max(0, potencia_solicitada)
         
-        # Calcular produção
-        producao_kg_h = self.calcular_producao(potencia_efetiva)
+        # Mesmas equações de calcular_producao e calcular_tensao_operacao,
+        # sem passar pelos métodos (caminho executado a cada hora)
+        p = self.parametros
+        
+        # Calcular produção - Eq. 2.9
+        producao_kg_h = potencia_efetiva * self._k_producao
         producao_periodo = producao_kg_h * delta_t_horas
         
         # Estimar tensão (simplificado)
         # Assumindo densidade de corrente proporcional à potência
-        area_celula = 100  # m² (valor típico)
-        j = (potencia_efetiva * 1000) / (self.parametros.tensao_reversivel * area_celula * 100)  # A/m²
-        V = self.calcular_tensao_operacao(j)
+        j = potencia_efetiva * self._k_corrente  # A/m²
+        V = _tafel(j, self._inv_j0, self._termo_tafel(self._T_K),
+                   p.resistencia_ohmica, p.tensao_reversivel)  # Eq. 2.8 e 2.29
         
         # Atualizar estado
         self.potencia_atual = potencia_efetiva
@@ -331,10 +561,7 @@ class Eletrolisador:
         self.producao_acumulada_kg += producao_periodo
         
         # Registrar histórico
-        self.historico['potencia'].append(potencia_efetiva)
-        self.historico['producao'].append(producao_periodo)
-        self.historico['temperatura'].append(self.temperatura_atual)
-        self.historico['tensao'].append(V)
+        self._push(potencia_efetiva, producao_periodo, self.temperatura_atual, V)
         
         resultado = {
             'potencia_operacao': potencia_efetiva,
@@ -347,6 +574,68 @@ class Eletrolisador:
         
         return resultado
     
+    def operar_array(self, potencias_solicitadas: np.ndarray, delta_t_horas: float = 1.0) -> Dict:
+        """
+        Opera o eletrolisador ao longo de uma série de potências
+        
+        Equivalente a chamar operar() para cada intervalo, mas os cálculos
+        são feitos de uma só vez pelo kernel compilado _simulate_kernel.
+        
+        Args:
+            potencias_solicitadas: Série de potências solicitadas (kW)
+            delta_t_horas: Intervalo de tempo de cada ponto da série (horas)
+        
+        Returns:
+            Dicionário com as mesmas chaves de operar(), cada uma com um
+            array de N valores (um por intervalo)
+        """
+        P_req = np.ascontiguousarray(potencias_solicitadas, dtype=np.float64)
+        n = P_req.shape[0]
+        
+        # Verificar limites operacionais
+        n_abaixo = int(np.count_nonzero((P_req > 0) & (P_req < self.P_min)))
+        if n_abaixo:
+            logger.warning("%d intervalos abaixo do mínimo (%.1f kW)", n_abaixo, self.P_min)
+        n_acima = int(np.count_nonzero(P_req > self.P_nom))
+        if n_acima:
+            logger.warning("%d intervalos acima do nominal (%.1f kW)", n_acima, self.P_nom)
+        
+        potencia = np.empty(n)
+        tensao = np.empty(n)
+        producao_kg_h = np.empty(n)
+        
+        p = self.parametros
+        _simulate_kernel(P_req, self.P_nom, p.eficiencia, p.tensao_reversivel,
+                         p.coeficiente_transferencia, p.resistencia_ohmica,
+                         p.densidade_corrente_troca, self.AREA_CELULA,
+                         self._T_K, self.F, self.R, self.h_L,
+                         potencia, tensao, producao_kg_h)
+        producao_periodo = producao_kg_h * delta_t_horas
+        
+        # Atualizar estado
+        if n:
+            self.potencia_atual = float(potencia[-1])
+        self.horas_operacao += delta_t_horas * n
+        self.producao_acumulada_kg += float(producao_periodo.sum())
+        
+        # Registrar histórico
+        self._reservar_historico(n)
+        fatia = slice(self._n, self._n + n)
+        self.historico['potencia'][fatia] = potencia
+        self.historico['producao'][fatia] = producao_periodo
+        self.historico['temperatura'][fatia] = self.temperatura_atual
+        self.historico['tensao'][fatia] = tensao
+        self._n += n
+        
+        return {
+            'potencia_operacao': potencia,
+            'producao_kg_h': producao_kg_h,
+            'producao_periodo_kg': producao_periodo,
+            'tensao_celula': tensao,
+            'temperatura': np.full(n, float(self.temperatura_atual)),
+            'eficiencia_instantanea': self.calcular_eficiencia_instantanea(potencia)
+        }
+    
     def calcular_eficiencia_instantanea(self, potencia: float) -> float:
         """
         Calcula eficiência instantânea considerando carga parcial
@@ -354,27 +643,30 @@ class Eletrolisador:
         A eficiência varia com a carga (curva típica)
         
         Args:
-            potencia: Potência de operação (kW)
+            potencia: Potência de operação (kW) - escalar ou np.ndarray
         
         Returns:
             Eficiência instantânea (0-1)
         """
-        if potencia <= 0:
-            return 0.0
+        # Modelo simplificado de eficiência vs carga (curva contínua)
+        # Máxima eficiência em carga nominal, menor em carga parcial
+        if isinstance(potencia, np.ndarray):
+            carga_rel = np.asarray(potencia, dtype=np.float64) / self.P_nom
+            fator_carga = np.interp(carga_rel, self._CARGA_XP, self._FATOR_FP)
+            return np.where(carga_rel > 0, self.parametros.eficiencia * fator_carga, 0.0)
         
-        # Carga relativa
+        # Escalar (chamado a cada intervalo por operar): interpolação sem NumPy
         carga_rel = potencia / self.P_nom
+        if not carga_rel > 0.0:
+            return 0.0
         
-        # Modelo simplificado de eficiência vs carga
-        # Máxima eficiência em carga nominal, menor em carga parcial
-        if carga_rel < 0.3:
-            fator_carga = 0.85  # 15% menos eficiente
-        elif carga_rel < 0.6:
-            fator_carga = 0.92
-        elif carga_rel < 0.9:
-            fator_carga = 0.98
+        xp = self._CARGA_PONTOS
+        fp = self._FATOR_PONTOS
+        i = bisect_right(xp, carga_rel)
+        if i == len(xp):
+            fator_carga = fp[-1]
         else:
-            fator_carga = 1.0
+            fator_carga = fp[i - 1] + (fp[i] - fp[i - 1]) * (carga_rel - xp[i - 1]) / (xp[i] - xp[i - 1])
         
         return self.parametros.eficiencia * fator_carga
     
@@ -429,19 +721,41 @@ class Eletrolisador:
     def get_historico(self) -> Dict:
         """
         Retorna o histórico de operação
+        
+        Os valores são views (sem cópia) dos buffers internos, válidas
+        até o próximo reset_historico().
         """
-        return self.historico.copy()
+        return {k: v[:self._n] for k, v in self.historico.items()}
     
     def reset_historico(self):
-        """Reseta o histórico de operação"""
-        self.historico = {
-            'potencia': [],
-            'producao': [],
-            'temperatura': [],
-            'tensao': []
-        }
+        """Reseta o histórico de operação (reaproveita os buffers já alocados)"""
+        self._n = 0
         logger.info("Histórico resetado")
     
+    def _reservar_historico(self, n_novos: int):
+        """Garante espaço no histórico para mais n_novos registros, dobrando a capacidade"""
+        necessario = self._n + n_novos
+        if necessario <= self._cap:
+            return
+        
+        while self._cap < necessario:
+            self._cap *= 2
+        
+        for chave, buffer in self.historico.items():
+            self.historico[chave] = np.resize(buffer, self._cap)
+    
+    def _push(self, potencia: float, producao: float, temperatura: float, tensao: float):
+        """Registra um intervalo de operação no histórico"""
+        if self._n == self._cap:
+            self._reservar_historico(1)
+        
+        i = self._n
+        self.historico['potencia'][i] = potencia
+        self.historico['producao'][i] = producao
+        self.historico['temperatura'][i] = temperatura
+        self.historico['tensao'][i] = tensao
+        self._n = i + 1
+    
     def __str__(self) -> str:
         """Representação em string do eletrolisador"""
         return (f"Eletrolisador {self.tipo} | "
@@ -450,6 +764,47 @@ class Eletrolisador:
                 f"Produção acumulada: {self.producao_acumulada_kg:.1f} kg H₂")
 
 
+# ==================== SIMULAÇÃO EM LOTE ====================
+
+def simular_tecnologias(eletrolisadores: List[Eletrolisador],
+                        potencias_solicitadas: np.ndarray) -> Dict:
+    """
+    Simula vários eletrolisadores sobre a mesma série de potências em uma única passada
+    
+    Cada linha do resultado (k, N) é calculada pelos métodos vetorizados do
+    respectivo eletrolisador (mesmos kernels e equações de
+    Eletrolisador.operar_array), escrevendo direto nas linhas dos arrays
+    de saída. O estado dos eletrolisadores não é alterado.
+    
+    Args:
+        eletrolisadores: Lista de eletrolisadores a comparar
+        potencias_solicitadas: Série de potências solicitadas (kW)
+    
+    Returns:
+        Dicionário com arrays (k, N) de potência, produção e tensão
+    """
+    P_req = np.ascontiguousarray(potencias_solicitadas, dtype=np.float64)
+    formato = (len(eletrolisadores), P_req.shape[0])
+    
+    potencia = np.empty(formato)
+    producao = np.empty(formato)
+    tensao = np.empty(formato)
+    
+    for i, elz in enumerate(eletrolisadores):
+        np.clip(P_req, 0.0, elz.P_nom, out=potencia[i])
+        elz.calcular_producao_array(P_req, out=producao[i])  # Eq. 2.9
+        
+        # Eq. 2.8 e 2.29 na temperatura atual de cada eletrolisador
+        j = elz.calcular_densidade_corrente(potencia[i])
+        elz.calcular_tensao_operacao_array(j, out=tensao[i])
+    
+    return {
+        'potencia_operacao': potencia,
+        'producao_kg_h': producao,
+        'tensao_celula': tensao
+    }
+
+
 # ==================== EXEMPLO DE USO ====================
 
 def exemplo_uso():
@@ -472,33 +827,39 @@ def exemplo_uso():
     
     # Testar produção com diferentes potências
     print(f"\n⚡ PRODUÇÃO DE H₂ (kg/h):")
-    for p in [200, 500, 800, 1000]:
-        prod_ael = ael.calcular_producao(p)
-        prod_pemel = pemel.calcular_producao(min(p, pemel.P_nom))
-        print(f"   {p:4d} kW → AEL: {prod_ael:5.2f} | PEMEL: {prod_pemel:5.2f}")
+    potencias_teste = np.array([200, 500, 800, 1000])
+    prod_ael = ael.calcular_producao_array(potencias_teste)
+    prod_pemel = pemel.calcular_producao_array(potencias_teste)
+    for p, pa, pp in zip(potencias_teste, prod_ael, prod_pemel):
+        print(f"   {p:4d} kW → AEL: {pa:5.2f} | PEMEL: {pp:5.2f}")
     
     # Simular operação por um dia
     print(f"\n⏱️ SIMULAÇÃO DE OPERAÇÃO (24h):")
     ael.reset_historico()
     
-    for hora in range(24):
-        # Perfil típico: mais potência durante o dia
-        if 8 <= hora <= 18:
-            potencia = 800 + np.random.normal(0, 50)
-        else:
-            potencia = 300 + np.random.normal(0, 30)
-        
-        resultado = ael.operar(potencia)
-        
-        if hora % 6 == 0:  # Mostrar a cada 6 horas
-            print(f"   Hora {hora:2d}: {resultado['potencia_operacao']:5.1f} kW → "
-                  f"{resultado['producao_periodo_kg']:5.2f} kg H₂")
+    # Perfil típico: mais potência durante o dia (gerado de uma só vez)
+    horas = np.arange(24)
+    diurno = (horas >= 8) & (horas <= 18)
+    potencias_dia = (np.where(diurno, 800.0, 300.0) +
+                     np.where(diurno, np.random.normal(0, 50, 24), np.random.normal(0, 30, 24)))
+    
+    resultado = ael.operar_array(potencias_dia)
+    
+    for hora in range(0, 24, 6):  # Mostrar a cada 6 horas
+        print(f"   Hora {hora:2d}: {resultado['potencia_operacao'][hora]:5.1f} kW → "
+              f"{resultado['producao_periodo_kg'][hora]:5.2f} kg H₂")
     
     print(f"\n📈 RESUMO DA SIMULAÇÃO:")
     print(f"   {ael}")
     print(f"   Produção total: {ael.producao_acumulada_kg:.1f} kg H₂")
     print(f"   Horas operação: {ael.horas_operacao:.0f} h")
     
+    # Comparação das tecnologias no mesmo perfil diário
+    print(f"\n🔀 COMPARAÇÃO NO MESMO PERFIL (24h):")
+    lote = simular_tecnologias([ael, pemel, soel], potencias_dia)
+    for elz, producao in zip([ael, pemel, soel], lote['producao_kg_h']):
+        print(f"   {elz.tipo}: {producao.sum():6.1f} kg H₂")
+    
     # Comparação de tensões
     print(f"\n🔋 TENSÃO DE OPERAÇÃO (j=1000 A/m²):")
     for elz in [ael, pemel, soel]:
@@ -510,6 +871,7 @@ def exemplo_uso():
 
 if __name__ == "__main__":
     # Executar exemplo quando o módulo for executado diretamente
+    logging.basicConfig(level=logging.INFO)
     exemplo_uso()
     
     print("\n" + "="*60)